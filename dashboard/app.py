@@ -9,6 +9,7 @@ import plotly.graph_objects as go
 import streamlit as st
 
 DB_PATH = Path("data/duckdb/crypto.duckdb")
+PARQUET_TRADES_DIR = Path("data/parquet/trades")
 
 # dbt-duckdb commonly creates schemas like main_marts, main_stg
 MARTS_SCHEMA = "main_marts"
@@ -23,6 +24,138 @@ def query_df(sql: str) -> pd.DataFrame:
         con.close()
 
 
+@st.cache_data(ttl=2)
+def query_tail_df(sql: str) -> pd.DataFrame:
+    # In-memory connection: the tail reads Parquet directly, never the DuckDB file
+    con = duckdb.connect()
+    try:
+        return con.execute(sql).fetchdf()
+    finally:
+        con.close()
+
+
+def mart_watermark_ms(pair: str) -> int | None:
+    """
+    Start of the newest minute materialized in the marts (epoch ms), or None.
+    That minute may be partial, so the live tail recomputes it from Parquet.
+    """
+    wm = query_df(
+        f"""
+        select cast(epoch(max(minute_bucket)) * 1000 as bigint) as wm_ms
+        from {MARTS_SCHEMA}.fct_candles_1m
+        where pair = '{pair}'
+        """
+    )
+    value = wm["wm_ms"].iloc[0] if not wm.empty else None
+    return None if pd.isna(value) else int(value)
+
+
+def tail_parquet_files(pair: str, from_ms: int) -> list[str]:
+    """
+    Parquet files in the hour= partitions at or after `from_ms`
+    (<root>/pair=<pair>/trade_date=YYYY-MM-DD/hour=HH/*.parquet).
+    """
+    from_dt = datetime.fromtimestamp(from_ms / 1000.0, tz=timezone.utc)
+    from_key = (from_dt.strftime("%Y-%m-%d"), from_dt.strftime("%H"))
+
+    files: list[str] = []
+    for date_dir in sorted((PARQUET_TRADES_DIR / f"pair={pair}").glob("trade_date=*")):
+        trade_date = date_dir.name.split("=", 1)[1]
+        if trade_date < from_key[0]:
+            continue
+        for hour_dir in sorted(date_dir.glob("hour=*")):
+            hour = hour_dir.name.split("=", 1)[1]
+            if (trade_date, hour) >= from_key:
+                files.extend(p.as_posix() for p in sorted(hour_dir.glob("*.parquet")))
+    return files
+
+
+def tail_base_sql(files: list[str], from_ms: int) -> str:
+    # Same casts and bucketing as stg_trades + marts, over the unmaterialized tail only
+    file_list = ", ".join("'" + f.replace("'", "''") + "'" for f in files)
+    return f"""
+    with src as (
+      select *
+      from read_parquet([{file_list}], hive_partitioning = true, union_by_name = true)
+    ),
+    base as (
+      select
+        pair,
+        to_timestamp(try_cast(trade_ts as bigint) / 1000.0) as trade_ts_utc,
+        date_trunc('minute', to_timestamp(try_cast(trade_ts as bigint) / 1000.0)) as minute_bucket,
+        try_cast(price as double) as price,
+        try_cast(qty as double) as qty,
+        try_cast(is_buyer_maker as boolean) as is_buyer_maker
+      from src
+      where try_cast(trade_ts as bigint) >= {from_ms}
+    )
+    """
+
+
+def tail_candles_sql(files: list[str], from_ms: int) -> str:
+    return tail_base_sql(files, from_ms) + """
+    select
+      pair,
+      minute_bucket,
+      arg_min(price, trade_ts_utc) as open_price,
+      max(price) as high_price,
+      min(price) as low_price,
+      arg_max(price, trade_ts_utc) as close_price,
+      sum(price * qty) / nullif(sum(qty), 0) as vwap,
+      count(*) as trade_count,
+      sum(qty) as total_qty,
+      sum(price * qty) as notional_usdt
+    from base
+    group by 1, 2
+    order by minute_bucket
+    """
+
+
+def tail_orderflow_sql(files: list[str], from_ms: int) -> str:
+    return tail_base_sql(files, from_ms) + """
+    , calc as (
+      select
+        pair,
+        minute_bucket,
+        count(*) as trade_count,
+        sum(qty) as total_qty,
+        sum(price * qty) as notional_usdt,
+        sum(case when is_buyer_maker = false then qty else 0 end) as buy_qty,
+        sum(case when is_buyer_maker = false then price * qty else 0 end) as buy_notional_usdt,
+        sum(case when is_buyer_maker = true then qty else 0 end) as sell_qty,
+        sum(case when is_buyer_maker = true then price * qty else 0 end) as sell_notional_usdt
+      from base
+      group by 1, 2
+    )
+    select
+      pair,
+      minute_bucket,
+      trade_count,
+      total_qty,
+      notional_usdt,
+      buy_qty,
+      sell_qty,
+      buy_notional_usdt,
+      sell_notional_usdt,
+      (buy_qty - sell_qty) as qty_imbalance,
+      (buy_notional_usdt - sell_notional_usdt) as notional_imbalance,
+      buy_qty / nullif(total_qty, 0) as buy_qty_ratio,
+      sell_qty / nullif(total_qty, 0) as sell_qty_ratio,
+      buy_notional_usdt / nullif(notional_usdt, 0) as buy_notional_ratio,
+      sell_notional_usdt / nullif(notional_usdt, 0) as sell_notional_ratio
+    from calc
+    order by minute_bucket
+    """
+
+
+def combine_live(mart: pd.DataFrame, tail: pd.DataFrame) -> pd.DataFrame:
+    if tail.empty:
+        return mart
+    if mart.empty:
+        return tail.reset_index(drop=True)
+    return pd.concat([mart, tail[mart.columns]], ignore_index=True)
+
+
 def table_exists(schema: str, table: str) -> bool:
     con = duckdb.connect(str(DB_PATH), read_only=True)
     try:
@@ -68,6 +201,35 @@ start_ts = end_ts - timedelta(minutes=int(lookback_minutes))
 
 st.sidebar.caption(f"Time window (UTC): {start_ts.strftime('%Y-%m-%d %H:%M')} → {end_ts.strftime('%H:%M')}")
 
+# Live tail: marts up to their watermark + direct scan of the newer hour= partitions
+live_mode = st.sidebar.checkbox("Live tail (read fresh Parquet)", value=False)
+# Round up to a whole minute: the mart query (minute_bucket >= start_ts) never shows a partial first minute
+start_ms = -(-int(start_ts.timestamp() * 1000) // 60000) * 60000
+tail_from_ms: int | None = None
+tail_files: list[str] = []
+tail_candles = tail_of = pd.DataFrame()
+
+if live_mode:
+    watermark_ms = mart_watermark_ms(pair)
+    tail_from_ms = start_ms if watermark_ms is None else max(watermark_ms, start_ms)
+    tail_files = tail_parquet_files(pair, tail_from_ms)
+    if tail_files:
+        try:
+            tail_candles = query_tail_df(tail_candles_sql(tail_files, tail_from_ms))
+            tail_of = query_tail_df(tail_orderflow_sql(tail_files, tail_from_ms))
+        except duckdb.Error as e:
+            st.warning(f"Live tail unavailable, showing marts only: {e}")
+            tail_files = []
+    wm_label = (
+        datetime.fromtimestamp(watermark_ms / 1000.0, tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+        if watermark_ms is not None
+        else "none"
+    )
+    st.sidebar.caption(f"Mart watermark (UTC): {wm_label} · tail files: {len(tail_files)}")
+
+# Mart rows at/after the tail start are replaced by the tail (the watermark minute may be partial)
+mart_cutoff = f"and epoch(minute_bucket) * 1000 < {tail_from_ms}" if tail_files else ""
+
 # Pipeline health (if exists)
 st.subheader("Pipeline Health")
 
@@ -85,9 +247,12 @@ select *
 from {MARTS_SCHEMA}.fct_candles_1m
 where pair = '{pair}'
   and minute_bucket >= TIMESTAMP '{start_ts.strftime("%Y-%m-%d %H:%M:%S")}'
+  {mart_cutoff}
 order by minute_bucket
 """
 candles = query_df(candles_sql)
+if tail_files:
+    candles = combine_live(candles, tail_candles)
 
 with col1:
     st.subheader("Candles (1m): OHLC + VWAP")
@@ -144,9 +309,12 @@ select *
 from {MARTS_SCHEMA}.fct_orderflow_1m
 where pair = '{pair}'
   and minute_bucket >= TIMESTAMP '{start_ts.strftime("%Y-%m-%d %H:%M:%S")}'
+  {mart_cutoff}
 order by minute_bucket
 """
 of = query_df(orderflow_sql)
+if tail_files:
+    of = combine_live(of, tail_of)
 
 if of.empty:
     st.warning("No orderflow data found in the selected window.")
@@ -171,4 +339,7 @@ limit 200
 trades = query_df(trades_sql)
 st.dataframe(trades, use_container_width=True)
 
-st.caption("Tip: Keep producer/consumer running and refresh the page to see new minutes appear.")
\ No newline at end of file
+st.caption(
+    "Tip: Keep producer/consumer running and refresh the page to see new minutes appear. "
+    "Enable *Live tail* to include minutes not yet built by dbt (the trades summary stays mart-only)."
+)
\ No newline at end of file
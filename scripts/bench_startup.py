@@ -0,0 +1,105 @@
+"""
+Startup-time benchmark for the producer and consumer workers.
+
+Spawns each worker N times and measures wall time from process start until it
+logs its starting event (emitted right before the first poll / first produce).
+Kafka does not need to be reachable: client construction is non-blocking.
+
+    python scripts/bench_startup.py --runs 5 --max-seconds 1.5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import queue
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = REPO_ROOT / "src"
+
+WORKERS = {
+    "producer": ("crypto_pipeline.producer.main", "producer_starting"),
+    "consumer": ("crypto_pipeline.consumer.main", "consumer_starting"),
+}
+
+
+def time_to_marker(module: str, marker: str, timeout: float) -> float:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    env["PYTHONUNBUFFERED"] = "1"
+
+    started = time.perf_counter()
+    deadline = started + timeout
+    proc = subprocess.Popen(
+        [sys.executable, "-m", module],
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+
+    # Reader thread so a worker that hangs without printing still hits the deadline
+    lines: queue.Queue[str | None] = queue.Queue()
+
+    def pump() -> None:
+        for line in proc.stdout:
+            lines.put(line)
+        lines.put(None)  # EOF
+
+    threading.Thread(target=pump, daemon=True).start()
+
+    try:
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                line = lines.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if line is None:
+                raise RuntimeError(f"{module} exited with code {proc.wait()} before logging {marker!r}")
+            if marker in line:
+                return time.perf_counter() - started
+        raise RuntimeError(f"{module} did not log {marker!r} within {timeout}s")
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--max-seconds", type=float, default=None, help="fail if a median exceeds this")
+    parser.add_argument("workers", nargs="*", help=f"subset of {', '.join(WORKERS)} (default: all)")
+    args = parser.parse_args()
+
+    # checked by hand: argparse validates a list default against `choices` and rejects it
+    unknown = [name for name in args.workers if name not in WORKERS]
+    if unknown:
+        parser.error(f"unknown worker(s): {', '.join(unknown)} (choose from {', '.join(WORKERS)})")
+    args.workers = args.workers or list(WORKERS)
+
+    failed = False
+    for name in args.workers:
+        module, marker = WORKERS[name]
+        samples = [time_to_marker(module, marker, args.timeout) for _ in range(args.runs)]
+        median = statistics.median(samples)
+        print(f"{name}: median={median:.3f}s min={min(samples):.3f}s max={max(samples):.3f}s runs={args.runs}")
+
+        if args.max_seconds is not None and median > args.max_seconds:
+            print(f"❌ {name} startup median {median:.3f}s exceeds {args.max_seconds:.3f}s")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import os
@@ -14,9 +16,14 @@ class Settings(BaseModel):
     binance_ws_url: str = "wss://stream.binance.com:9443/ws/btcusdt@trade"
 
     log_level: str = "INFO"
+    log_sample_limits: str = "dlq_published=5,parquet_written=20,kafka_delivery_failed=5"  # max events per window, per event name
+    log_sample_window_seconds: float = 1.0
+    log_queue_size: int = 10000
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
+    # read .env and validate once per process, on first call (not at import time)
     load_dotenv()
     return Settings(
         kafka_bootstrap=os.getenv("KAFKA_BOOTSTRAP", "localhost:9092"),
@@ -26,4 +33,7 @@ def load_settings() -> Settings:
         kafka_topic_dlq=os.getenv("KAFKA_TOPIC_DLQ", "crypto.trades.dlq.v1"), ##DLQ
         binance_ws_url=os.getenv("BINANCE_WS_URL", "wss://stream.binance.com:9443/ws/btcusdt@trade"),
         log_level=os.getenv("LOG_LEVEL", "INFO"),
+        log_sample_limits=os.getenv("LOG_SAMPLE_LIMITS", "dlq_published=5,parquet_written=20,kafka_delivery_failed=5"),
+        log_sample_window_seconds=float(os.getenv("LOG_SAMPLE_WINDOW_SECONDS", "1.0")),
+        log_queue_size=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
     )
\ No newline at end of file
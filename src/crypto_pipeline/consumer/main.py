@@ -6,14 +6,13 @@ from collections import defaultdict
 from typing import Any
 
 import orjson
-import polars as pl
 import structlog
 from confluent_kafka import Consumer, KafkaException, TopicPartition
 
 from crypto_pipeline.config import load_settings
-from crypto_pipeline.logging import setup_logging
+from crypto_pipeline.logging import parse_sample_limits, setup_logging
 from crypto_pipeline.consumer.writer_parquet import ParquetWriter
-from crypto_pipeline.producer.publisher import KafkaPublisher
+from crypto_pipeline.producer.publisher import LazyKafkaPublisher
 from crypto_pipeline.storage.layout import parquet_partition_path
 from crypto_pipeline.utils.time import trade_partitions
 
@@ -63,6 +62,8 @@ def flush_batch(
     if not records:
         return
 
+    import polars as pl  # deferred: keeps worker startup fast until the first flush
+
     # Group by (pair, trade_date, hour) → one parquet per group per flush
     grouped: dict[tuple[str, str, str], list[dict[str, Any]]] = defaultdict(list)
     for r in records:
@@ -101,7 +102,12 @@ def flush_batch(
 
 def run() -> None:
     settings = load_settings()
-    setup_logging(settings.log_level)
+    setup_logging(
+        settings.log_level,
+        sample_limits=parse_sample_limits(settings.log_sample_limits),
+        sample_window_seconds=settings.log_sample_window_seconds,
+        queue_size=settings.log_queue_size,
+    )
 
     parquet_root = os.getenv("PARQUET_ROOT", "./data/parquet")
     parquet_subdir = os.getenv("PARQUET_TOPIC_SUBDIR", "trades")
@@ -112,8 +118,8 @@ def run() -> None:
     consumer = build_consumer(settings)
     consumer.subscribe([settings.kafka_topic_trades])
 
-    # Reuse our KafkaPublisher for DLQ publishing (no WS here, just Kafka produce)
-    dlq_publisher = KafkaPublisher(
+    # Reuse our KafkaPublisher for DLQ publishing; the client is only created on the first bad event
+    dlq_publisher = LazyKafkaPublisher(
         bootstrap=settings.kafka_bootstrap,
         client_id="crypto-consumer-dlq",
         acks="all",
@@ -183,7 +189,7 @@ def run() -> None:
                     value=payload,
                 )
                 offsets_map[(topic, partition)] = next_offset
-                log.warn("dlq_published", error=str(e), dlq_count=dlq_count)
+                log.warning("dlq_published", error=str(e), dlq_count=dlq_count)
 
             if len(records) >= batch_size or (now - last_flush >= flush_seconds):
                 offsets_to_commit = [
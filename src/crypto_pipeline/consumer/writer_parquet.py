@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
-import polars as pl
+if TYPE_CHECKING:
+    import polars as pl
 
 
 class ParquetWriter:
@@ -15,7 +18,14 @@ class ParquetWriter:
         out_dir.mkdir(parents=True, exist_ok=True)
         fname = f"part-{uuid4().hex}.parquet"
         out_path = out_dir / fname
+        # readers glob *.parquet: write under a temp name, then rename atomically
+        tmp_path = out_dir / f".{fname}.tmp"
 
         # Polars parquet write
-        df.write_parquet(str(out_path), compression="zstd")
+        try:
+            df.write_parquet(str(tmp_path), compression="zstd")
+            os.replace(tmp_path, out_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
         return out_path
\ No newline at end of file
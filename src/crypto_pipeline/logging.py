@@ -1,25 +1,234 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener
+
 import structlog
 
+_listener: QueueListener | None = None
+_queue_handler: _NonBlockingQueueHandler | None = None
+_sampler: EventSampler | None = None
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread untouched (rendering happens there)
+    and drops them instead of blocking when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def take_dropped(self) -> int:
+        """Returns records dropped since the last call, and resets the count."""
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+
+class EventSampler:
+    """
+    structlog processor capping how often each listed event is emitted per window.
+
+    Events over the limit are dropped and counted. A daemon thread closes the
+    window every `window_seconds` and logs one `log_events_suppressed` summary
+    per throttled event, e.g. "dlq_published suppressed=950 window_s=1.0", plus
+    `log_records_dropped` for records lost to a full log queue (`take_dropped`).
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, int],
+        window_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        take_dropped: Callable[[], int] | None = None,
+    ) -> None:
+        self.limits = limits
+        self._take_dropped = take_dropped
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window_start = clock()
+        self._emitted: dict[str, int] = {}
+        self._suppressed: dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __call__(self, logger, method_name: str, event_dict: dict) -> dict:
+        event = event_dict.get("event")
+        limit = self.limits.get(event)
+        if limit is None:
+            return event_dict
+
+        with self._lock:
+            emitted = self._emitted.get(event, 0)
+            if emitted >= limit:
+                self._suppressed[event] = self._suppressed.get(event, 0) + 1
+                raise structlog.DropEvent
+            self._emitted[event] = emitted + 1
+        return event_dict
+
+    def close_window(self) -> tuple[dict[str, int], float]:
+        """Resets the window; returns its suppressed counts and actual length in seconds."""
+        now = self._clock()
+        with self._lock:
+            suppressed = self._suppressed
+            window_s = now - self._window_start
+            self._emitted = {}
+            self._suppressed = {}
+            self._window_start = now
+        return suppressed, window_s
+
+    def report(self) -> None:
+        suppressed, window_s = self.close_window()
+        dropped = self._take_dropped() if self._take_dropped is not None else 0
+        if not suppressed and not dropped:
+            return
+        log = structlog.get_logger()
+        if dropped:
+            log.warning("log_records_dropped", dropped=dropped, window_s=round(window_s, 3))
+        for event, count in suppressed.items():
+            log.info(
+                "log_events_suppressed",
+                sampled_event=event,
+                suppressed=count,
+                window_s=round(window_s, 3),
+            )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.window_seconds):
+            self.report()
+
+    def start(self) -> None:
+        if (self.limits or self._take_dropped is not None) and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.report()
+
 
-def setup_logging(log_level: str = "INFO") -> None:
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper(), logging.INFO),
+def parse_sample_limits(spec: str) -> dict[str, int]:
+    """
+    "dlq_published=5,parquet_written=20" -> {"dlq_published": 5, "parquet_written": 20}
+    """
+    limits: dict[str, int] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        event, sep, limit = item.partition("=")
+        try:
+            if not sep or not event.strip():
+                raise ValueError
+            limits[event.strip()] = int(limit)
+        except ValueError:
+            raise ValueError(
+                f"Invalid LOG_SAMPLE_LIMITS entry {item!r}: expected <event>=<max events per window>"
+            ) from None
+    return limits
+
+
+def debug_enabled() -> bool:
+    """Cheap level check so hot paths can skip building debug payloads."""
+    return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+
+def _shutdown() -> None:
+    global _listener, _queue_handler, _sampler
+
+    if _sampler is not None:
+        _sampler.stop()  # logs the final window's summary
+        _sampler = None
+
+    if _listener is not None:
+        _listener.stop()  # drains the queue before returning
+        _listener = None
+    _queue_handler = None
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    sample_limits: dict[str, int] | None = None,
+    sample_window_seconds: float = 1.0,
+    queue_size: int = 10000,
+) -> None:
+    """
+    JSON logs rendered and written to stdout on a background thread.
+
+    The calling thread only filters by level, applies per-event sampling and
+    enqueues the record, so a slow stdout / log collector cannot stall ingestion.
+    """
+    global _listener, _queue_handler, _sampler
+
+    _shutdown()
+
+    level = getattr(logging, log_level.upper(), logging.INFO)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            processor=structlog.processors.JSONRenderer(),
+            foreign_pre_chain=[
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.stdlib.add_log_level,
+            ],
+        )
     )
 
+    _queue_handler = _NonBlockingQueueHandler(queue.Queue(maxsize=queue_size))
+    _listener = QueueListener(_queue_handler.queue, stream_handler, respect_handler_level=False)
+    _listener.start()
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    _sampler = EventSampler(
+        sample_limits or {},
+        window_seconds=sample_window_seconds,
+        take_dropped=_queue_handler.take_dropped,
+    )
+    _sampler.start()
+
     structlog.configure(
         processors=[
+            structlog.stdlib.filter_by_level,
+            _sampler,
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
-    )
\ No newline at end of file
+    )
+
+
+atexit.register(_shutdown)
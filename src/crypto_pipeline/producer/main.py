@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import json
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import lru_cache
+from importlib.resources import files
 from uuid import uuid4
 
 import orjson
 import structlog
-import websockets
-from jsonschema import validate
 
 from crypto_pipeline.config import load_settings
-from crypto_pipeline.logging import setup_logging
+from crypto_pipeline.logging import parse_sample_limits, setup_logging
 from crypto_pipeline.producer.publisher import KafkaPublisher
 
 log = structlog.get_logger()
@@ -24,10 +25,31 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@lru_cache(maxsize=1)
 def load_trade_schema() -> dict:
-    # small and local → load once on startup
-    with open("src/crypto_pipeline/schemas/trade_v1.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    # shipped as package data → works from any working directory
+    resource = files("crypto_pipeline") / "schemas" / "trade_v1.json"
+    return json.loads(resource.read_text(encoding="utf-8"))
+
+
+def build_trade_validator() -> Callable[[dict], None]:
+    # jsonschema is heavy to import; all of it is loaded here, once, and the
+    # checked validator is reused for every event
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
+
+    schema = load_trade_schema()
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+
+    def validate(event: dict) -> None:
+        # same error as jsonschema.validate(): the most relevant one, not just the first found
+        error = best_match(validator.iter_errors(event))
+        if error is not None:
+            raise error
+
+    return validate
 
 
 def transform_binance_trade(msg: dict) -> dict:
@@ -48,10 +70,17 @@ def transform_binance_trade(msg: dict) -> dict:
 
 
 async def run() -> None:
+    import websockets
+
     settings = load_settings()
-    setup_logging(settings.log_level)
+    setup_logging(
+        settings.log_level,
+        sample_limits=parse_sample_limits(settings.log_sample_limits),
+        sample_window_seconds=settings.log_sample_window_seconds,
+        queue_size=settings.log_queue_size,
+    )
 
-    schema = load_trade_schema()
+    validate_event = build_trade_validator()
     publisher = KafkaPublisher(
         bootstrap=settings.kafka_bootstrap,
         client_id=settings.kafka_client_id,
@@ -70,7 +99,7 @@ async def run() -> None:
                     event = transform_binance_trade(msg)
 
                     # validate (fast enough for single stream; can be toggled later)
-                    validate(instance=event, schema=schema)
+                    validate_event(event)
 
                     publisher.publish(
                         topic=settings.kafka_topic_trades,
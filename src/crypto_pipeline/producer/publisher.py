@@ -3,6 +3,8 @@ from __future__ import annotations
 from confluent_kafka import Producer
 import structlog
 
+from crypto_pipeline.logging import debug_enabled
+
 log = structlog.get_logger()
 
 
@@ -20,20 +22,41 @@ class KafkaPublisher:
             }
         )
 
+    @staticmethod
+    def _delivery_report(err, msg) -> None:
+        if err is not None:
+            log.error("kafka_delivery_failed", error=str(err))
+        elif debug_enabled():  # skip building the payload per message unless debugging
+            log.debug(
+                "kafka_delivered",
+                topic=msg.topic(),
+                partition=msg.partition(),
+                offset=msg.offset(),
+            )
+
     def publish(self, topic: str, key: str, value: bytes) -> None:
-        def delivery_report(err, msg):
-            if err is not None:
-                log.error("kafka_delivery_failed", error=str(err))
-            else:
-                log.debug(
-                    "kafka_delivered",
-                    topic=msg.topic(),
-                    partition=msg.partition(),
-                    offset=msg.offset(),
-                )
-
-        self._producer.produce(topic=topic, key=key, value=value, on_delivery=delivery_report)
+        self._producer.produce(topic=topic, key=key, value=value, on_delivery=self._delivery_report)
         self._producer.poll(0)  # trigger delivery callbacks
 
     def flush(self, timeout: float = 10.0) -> None:
-        self._producer.flush(timeout)
\ No newline at end of file
+        self._producer.flush(timeout)
+
+
+class LazyKafkaPublisher:
+    """
+    KafkaPublisher created on first publish. For rarely used topics (DLQ)
+    this keeps the producer client out of worker startup.
+    """
+
+    def __init__(self, bootstrap: str, client_id: str, acks: str = "all") -> None:
+        self._kwargs = {"bootstrap": bootstrap, "client_id": client_id, "acks": acks}
+        self._publisher: KafkaPublisher | None = None
+
+    def publish(self, topic: str, key: str, value: bytes) -> None:
+        if self._publisher is None:
+            self._publisher = KafkaPublisher(**self._kwargs)
+        self._publisher.publish(topic=topic, key=key, value=value)
+
+    def flush(self, timeout: float = 10.0) -> None:
+        if self._publisher is not None:
+            self._publisher.flush(timeout)